@@ -1,6 +1,12 @@
-from django.core.handlers.base import BaseHandler
+import copy
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from django.utils.module_loading import import_string
 from freezegun import freeze_time
 
+from ...account.models import User
 from ..jwt import (
     JWT_REFRESH_TOKEN_COOKIE_NAME,
     JWT_REFRESH_TYPE,
@@ -8,110 +14,118 @@ from ..jwt import (
     jwt_encode,
     jwt_user_payload,
 )
+from ..middleware import jwt_refresh_token_middleware, plugins
 
+ACTIVE_PLUGIN_PATH = "saleor.plugins.tests.sample_plugins.ActivePlugin"
+ACTIVE_PLUGINS = [ACTIVE_PLUGIN_PATH]
+
+
+def get_response(request):
+    return HttpResponse()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def frozen_time():
+    with freeze_time("2020-03-18 12:00:00"):
+        yield
+
+
+@pytest.fixture(scope="module")
+def prototype_request():
+    return RequestFactory().request()
+
+
+@pytest.fixture
+def request_copy(prototype_request):
+    # Tests only set attributes on the request, so a shallow copy is enough.
+    return copy.copy(prototype_request)
+
+
+@pytest.fixture(scope="module")
+def frozen_refresh_token(frozen_time):
+    # The middleware only needs a signed token, not a persisted user, so the token
+    # is signed once per module instead of once per test.
+    user = User(email="test@example.com")
+    return create_refresh_token(user)
 
-@freeze_time("2020-03-18 12:00:00")
-def test_jwt_refresh_token_middleware(rf, customer_user, settings):
-    refresh_token = create_refresh_token(customer_user)
-    settings.MIDDLEWARE = [
-        "saleor.core.middleware.jwt_refresh_token_middleware",
-    ]
-    request = rf.request()
-    request.refresh_token = refresh_token
-    handler = BaseHandler()
-    handler.load_middleware()
-    response = handler.get_response(request)
-    cookie = response.cookies.get(JWT_REFRESH_TOKEN_COOKIE_NAME)
-    assert cookie.value == refresh_token
 
+@pytest.fixture(scope="module")
+def module_customer_user(django_db_setup, django_db_blocker):
+    # Created once per module outside of the per-test transaction, so tests using
+    # it must not modify it.
+    with django_db_blocker.unblock():
+        user = User.objects.create_user("middleware@example.com", "password")
+    yield user
+    with django_db_blocker.unblock():
+        user.delete()
 
-@freeze_time("2020-03-18 12:00:00")
-def test_jwt_refresh_token_middleware_token_without_expire(rf, customer_user, settings):
-    settings.JWT_EXPIRE = True
-    payload = jwt_user_payload(
-        customer_user,
-        JWT_REFRESH_TYPE,
-        settings.JWT_TTL_REFRESH,
-    )
-    del payload["exp"]
-
-    refresh_token = jwt_encode(payload)
-    settings.MIDDLEWARE = [
-        "saleor.core.middleware.jwt_refresh_token_middleware",
-    ]
-    request = rf.request()
-    request.refresh_token = refresh_token
-    handler = BaseHandler()
-    handler.load_middleware()
-    response = handler.get_response(request)
-    cookie = response.cookies.get(JWT_REFRESH_TOKEN_COOKIE_NAME)
+
+@pytest.fixture(scope="module")
+def refresh_token_without_expire(frozen_time):
+    user = User(email="test@example.com")
+    payload = jwt_user_payload(user, JWT_REFRESH_TYPE, exp_delta=None)
+    return jwt_encode(payload)
+
+
+@pytest.fixture(scope="session")
+def active_plugin_class():
+    return import_string(ACTIVE_PLUGIN_PATH)
+
+
+@pytest.fixture
+def cached_active_plugin_import(active_plugin_class, monkeypatch):
+    def _import_string(dotted_path):
+        if dotted_path == ACTIVE_PLUGIN_PATH:
+            return active_plugin_class
+        return import_string(dotted_path)
+
+    monkeypatch.setattr("saleor.plugins.manager.import_string", _import_string)
+
+
+@pytest.mark.parametrize(
+    "debug, refresh_token_fixture, expected_samesite",
+    [
+        (False, "frozen_refresh_token", "None"),
+        (False, "refresh_token_without_expire", "None"),
+        (True, "frozen_refresh_token", "Lax"),
+    ],
+)
+def test_jwt_refresh_token_middleware(
+    debug, refresh_token_fixture, expected_samesite, request, request_copy, settings
+):
+    settings.DEBUG = debug
+    refresh_token = request.getfixturevalue(refresh_token_fixture)
+    request_copy.refresh_token = refresh_token
+    response = jwt_refresh_token_middleware(get_response)(request_copy)
+    cookie = response.cookies[JWT_REFRESH_TOKEN_COOKIE_NAME]
     assert cookie.value == refresh_token
+    assert cookie["samesite"] == expected_samesite
 
 
-@freeze_time("2020-03-18 12:00:00")
-def test_jwt_refresh_token_middleware_samesite_debug_mode(rf, customer_user, settings):
-    refresh_token = create_refresh_token(customer_user)
-    settings.MIDDLEWARE = [
-        "saleor.core.middleware.jwt_refresh_token_middleware",
-    ]
-    settings.DEBUG = True
-    request = rf.request()
-    request.refresh_token = refresh_token
-    handler = BaseHandler()
-    handler.load_middleware()
-    response = handler.get_response(request)
-    cookie = response.cookies.get(JWT_REFRESH_TOKEN_COOKIE_NAME)
-    assert cookie["samesite"] == "Lax"
-
-
-@freeze_time("2020-03-18 12:00:00")
-def test_jwt_refresh_token_middleware_samesite_none(rf, customer_user, settings):
-    refresh_token = create_refresh_token(customer_user)
-    settings.MIDDLEWARE = [
-        "saleor.core.middleware.jwt_refresh_token_middleware",
-    ]
-    settings.DEBUG = False
-    request = rf.request()
-    request.refresh_token = refresh_token
-    handler = BaseHandler()
-    handler.load_middleware()
-    response = handler.get_response(request)
-    cookie = response.cookies.get(JWT_REFRESH_TOKEN_COOKIE_NAME)
-    assert cookie["samesite"] == "None"
-
-
-def test_plugins_middleware_loads_requestor_in_plugin(rf, customer_user, settings):
-    settings.MIDDLEWARE = [
-        "saleor.core.middleware.plugins",
-    ]
-    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.ActivePlugin"]
-    request = rf.request()
-    request.user = customer_user
+@override_settings(PLUGINS=ACTIVE_PLUGINS)
+def test_plugins_middleware_loads_requestor_in_plugin(
+    request_copy, module_customer_user, cached_active_plugin_import
+):
+    request = request_copy
+    request.user = module_customer_user
     request.app = None
 
-    handler = BaseHandler()
-    handler.load_middleware()
-    handler.get_response(request)
+    plugins(get_response)(request)
     plugin = request.plugins.all_plugins.pop()
 
-    assert isinstance(plugin.requestor, type(customer_user))
-    assert plugin.requestor.id == customer_user.id
+    assert isinstance(plugin.requestor, User)
+    assert plugin.requestor.id == module_customer_user.id
 
 
+@override_settings(PLUGINS=ACTIVE_PLUGINS)
 def test_plugins_middleware_requestor_in_plugin_when_no_app_and_user_in_req_is_none(
-    rf, settings
+    request_copy, cached_active_plugin_import
 ):
-    settings.MIDDLEWARE = [
-        "saleor.core.middleware.plugins",
-    ]
-    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.ActivePlugin"]
-    request = rf.request()
+    request = request_copy
     request.user = None
     request.app = None
 
-    handler = BaseHandler()
-    handler.load_middleware()
-    handler.get_response(request)
+    plugins(get_response)(request)
     plugin = request.plugins.all_plugins.pop()
 
     assert not plugin.requestor
@@ -190,15 +190,20 @@ def validate_variants_are_published(variants_id: set, channel_id: int):
         )
 
 
+def get_checkout_queryset():
+    return models.Checkout.objects.select_related(
+        "channel",
+        "user",
+        "shipping_method",
+        "collection_point",
+        "billing_address",
+        "shipping_address",
+    )
+
+
 def get_checkout_by_token(token: uuid.UUID, qs=None):
     if qs is None:
-        qs = models.Checkout.objects.select_related(
-            "channel",
-            "shipping_method",
-            "collection_point",
-            "billing_address",
-            "shipping_address",
-        )
+        qs = get_checkout_queryset()
     try:
         checkout = qs.get(token=token)
     except ObjectDoesNotExist:
@@ -1,9 +1,10 @@
-from typing import TYPE_CHECKING, List
+from typing import List
 
 import graphene
 from django.core.exceptions import ValidationError
 
 from ...channel.models import Channel
+from ...checkout import models as checkout_models
 from ...checkout.calculations import calculate_checkout_total_with_gift_cards
 from ...checkout.checkout_cleaner import clean_billing_address, clean_checkout_shipping
 from ...checkout.fetch import fetch_checkout_info, fetch_checkout_lines
@@ -13,11 +14,12 @@ from ...core.permissions import OrderPermissions
 from ...core.utils import get_client_ip
 from ...core.utils.url import validate_storefront_url
 from ...payment import PaymentError, StorePaymentMethod, gateway
+from ...payment import models as payment_models
 from ...payment.error_codes import PaymentErrorCode
 from ...payment.utils import create_payment, is_currency_supported
 from ..account.i18n import I18nMixin
 from ..channel.utils import validate_channel
-from ..checkout.mutations.utils import get_checkout_by_token
+from ..checkout.mutations.utils import get_checkout_by_token, get_checkout_queryset
 from ..checkout.types import Checkout
 from ..core.descriptions import ADDED_IN_31, DEPRECATED_IN_3X_INPUT
 from ..core.enums import to_enum
@@ -28,29 +30,25 @@ from ..core.types import common as common_types
 from ..core.validators import validate_one_of_args_is_in_mutation
 from ..meta.mutations import MetadataInput
 from .types import Payment, PaymentInitialized
-from .utils import metadata_contains_empty_key
 
-if TYPE_CHECKING:
-    from ...checkout import models as checkout_models
+STORE_PAYMENT_METHOD_DESCRIPTIONS = {
+    StorePaymentMethod.NONE: "Storage is disabled. The payment is not stored.",
+    StorePaymentMethod.ON_SESSION: (
+        "On session storage type. "
+        "The payment is stored only to be reused when "
+        "the customer is present in the checkout flow."
+    ),
+    StorePaymentMethod.OFF_SESSION: (
+        "Off session storage type. "
+        "The payment is stored to be reused even if the customer is absent."
+    ),
+}
 
 
 def description(enum):
     if enum is None:
         return "Enum representing the type of a payment storage in a gateway."
-    elif enum == StorePaymentMethodEnum.NONE:
-        return "Storage is disabled. The payment is not stored."
-    elif enum == StorePaymentMethodEnum.ON_SESSION:
-        return (
-            "On session storage type. "
-            "The payment is stored only to be reused when "
-            "the customer is present in the checkout flow."
-        )
-    elif enum == StorePaymentMethodEnum.OFF_SESSION:
-        return (
-            "Off session storage type. "
-            "The payment is stored to be reused even if the customer is absent."
-        )
-    return None
+    return STORE_PAYMENT_METHOD_DESCRIPTIONS.get(enum.value)
 
 
 StorePaymentMethodEnum = to_enum(
@@ -58,6 +56,27 @@ StorePaymentMethodEnum = to_enum(
 )
 
 
+def get_payment_with_channel_queryset():
+    return payment_models.Payment.objects.select_related(
+        "order__channel", "checkout__channel"
+    )
+
+
+def get_payment_channel_slug(payment: "payment_models.Payment") -> str:
+    if payment.order:
+        return payment.order.channel.slug
+    if payment.checkout:
+        return payment.checkout.channel.slug
+    raise ValidationError(
+        {
+            "payment_id": ValidationError(
+                "Payment is not assigned to any order or checkout.",
+                code=PaymentErrorCode.INVALID.value,
+            )
+        }
+    )
+
+
 class PaymentInput(graphene.InputObjectType):
     gateway = graphene.Field(
         graphene.String,
@@ -178,20 +197,24 @@ class CheckoutPaymentCreate(BaseMutation, I18nMixin):
             )
 
     @classmethod
-    def validate_metadata_keys(cls, metadata_list: List[dict]):
-        if metadata_contains_empty_key(metadata_list):
-            raise ValidationError(
-                {
-                    "input": ValidationError(
-                        {
-                            "metadata": ValidationError(
-                                "Metadata key cannot be empty.",
-                                code=MetadataErrorCode.REQUIRED.value,
-                            )
-                        }
-                    )
-                }
-            )
+    def clean_metadata(cls, metadata_list: List[dict]) -> dict:
+        metadata = {}
+        for data in metadata_list:
+            if not data["key"].strip():
+                raise ValidationError(
+                    {
+                        "input": ValidationError(
+                            {
+                                "metadata": ValidationError(
+                                    "Metadata key cannot be empty.",
+                                    code=MetadataErrorCode.REQUIRED.value,
+                                )
+                            }
+                        )
+                    }
+                )
+            metadata[data["key"]] = data["value"]
+        return metadata
 
     @staticmethod
     def validate_checkout_email(checkout: "checkout_models.Checkout"):
@@ -208,12 +231,17 @@ class CheckoutPaymentCreate(BaseMutation, I18nMixin):
             PaymentErrorCode, "checkout_id", checkout_id, "token", token
         )
 
+        qs = get_checkout_queryset()
         if token:
-            checkout = get_checkout_by_token(token)
+            checkout = get_checkout_by_token(token, qs=qs)
         # DEPRECATED
         else:
             checkout = cls.get_node_or_error(
-                info, checkout_id or token, only_type=Checkout, field="checkout_id"
+                info,
+                checkout_id or token,
+                only_type=Checkout,
+                field="checkout_id",
+                qs=qs,
             )
 
         cls.validate_checkout_email(checkout)
@@ -267,24 +295,26 @@ class CheckoutPaymentCreate(BaseMutation, I18nMixin):
             address=address,
             discounts=info.context.discounts,
         )
-        amount = data.get("amount", checkout_total.gross.amount)
         clean_checkout_shipping(checkout_info, lines, PaymentErrorCode)
         clean_billing_address(checkout_info, PaymentErrorCode)
-        cls.clean_payment_amount(info, checkout_total, amount)
-        extra_data = {
-            "customer_user_agent": info.context.META.get("HTTP_USER_AGENT"),
-        }
+        amount = data.get("amount")
+        if amount is None:
+            amount = checkout_total.gross.amount
+        else:
+            cls.clean_payment_amount(info, checkout_total, amount)
 
         cancel_active_payments(checkout)
 
         metadata = data.get("metadata")
 
         if metadata is not None:
-            cls.validate_metadata_keys(metadata)
-            metadata = {data.key: data.value for data in metadata}
+            metadata = cls.clean_metadata(metadata)
 
         payment = None
         if amount != 0:
+            extra_data = {
+                "customer_user_agent": info.context.META.get("HTTP_USER_AGENT"),
+            }
             payment = create_payment(
                 gateway=gateway,
                 payment_token=data.get("token", ""),
@@ -319,18 +349,18 @@ class PaymentCapture(BaseMutation):
     @classmethod
     def perform_mutation(cls, _root, info, payment_id, amount=None):
         payment = cls.get_node_or_error(
-            info, payment_id, field="payment_id", only_type=Payment
-        )
-        channel_slug = (
-            payment.order.channel.slug
-            if payment.order
-            else payment.checkout.channel.slug
+            info,
+            payment_id,
+            field="payment_id",
+            only_type=Payment,
+            qs=get_payment_with_channel_queryset(),
         )
+        channel_slug = get_payment_channel_slug(payment)
         try:
             gateway.capture(
                 payment, info.context.plugins, amount=amount, channel_slug=channel_slug
             )
-            payment.refresh_from_db()
+            payment = get_payment_with_channel_queryset().get(pk=payment.pk)
         except PaymentError as e:
             raise ValidationError(str(e), code=PaymentErrorCode.PAYMENT_ERROR)
         return PaymentCapture(payment=payment)
@@ -346,18 +376,18 @@ class PaymentRefund(PaymentCapture):
     @classmethod
     def perform_mutation(cls, _root, info, payment_id, amount=None):
         payment = cls.get_node_or_error(
-            info, payment_id, field="payment_id", only_type=Payment
-        )
-        channel_slug = (
-            payment.order.channel.slug
-            if payment.order
-            else payment.checkout.channel.slug
+            info,
+            payment_id,
+            field="payment_id",
+            only_type=Payment,
+            qs=get_payment_with_channel_queryset(),
         )
+        channel_slug = get_payment_channel_slug(payment)
         try:
             gateway.refund(
                 payment, info.context.plugins, amount=amount, channel_slug=channel_slug
             )
-            payment.refresh_from_db()
+            payment = get_payment_with_channel_queryset().get(pk=payment.pk)
         except PaymentError as e:
             raise ValidationError(str(e), code=PaymentErrorCode.PAYMENT_ERROR)
         return PaymentRefund(payment=payment)
@@ -378,16 +408,16 @@ class PaymentVoid(BaseMutation):
     @classmethod
     def perform_mutation(cls, _root, info, payment_id):
         payment = cls.get_node_or_error(
-            info, payment_id, field="payment_id", only_type=Payment
-        )
-        channel_slug = (
-            payment.order.channel.slug
-            if payment.order
-            else payment.checkout.channel.slug
+            info,
+            payment_id,
+            field="payment_id",
+            only_type=Payment,
+            qs=get_payment_with_channel_queryset(),
         )
+        channel_slug = get_payment_channel_slug(payment)
         try:
             gateway.void(payment, info.context.plugins, channel_slug=channel_slug)
-            payment.refresh_from_db()
+            payment = get_payment_with_channel_queryset().get(pk=payment.pk)
         except PaymentError as e:
             raise ValidationError(str(e), code=PaymentErrorCode.PAYMENT_ERROR)
         return PaymentVoid(payment=payment)
@@ -419,7 +449,7 @@ class PaymentInitialize(BaseMutation):
     @classmethod
     def validate_channel(cls, channel_slug):
         try:
-            channel = Channel.objects.get(slug=channel_slug)
+            channel = Channel.objects.only("slug", "is_active").get(slug=channel_slug)
         except Channel.DoesNotExist:
             raise ValidationError(
                 {
@@ -509,8 +539,16 @@ class PaymentCheckBalance(BaseMutation):
         gateway_id = data["input"]["gateway_id"]
         money = data["input"]["card"].get("money", {})
 
-        cls.validate_gateway(gateway_id, manager)
-        cls.validate_currency(money.currency, gateway_id, manager)
+        # Gateways available for the currency are a subset of all gateways, so all
+        # gateways are only listed to report an unknown gateway_id.
+        currency_gateway_ids = {
+            gateway.id
+            for gateway in manager.list_payment_gateways(currency=money.currency)
+        }
+        if gateway_id not in currency_gateway_ids:
+            gateway_ids = {gateway.id for gateway in manager.list_payment_gateways()}
+            cls.validate_gateway(gateway_id, gateway_ids)
+        cls.validate_currency(money.currency, gateway_id, currency_gateway_ids)
 
         channel = data["input"].pop("channel")
         validate_channel(channel, PaymentErrorCode)
@@ -525,10 +563,8 @@ class PaymentCheckBalance(BaseMutation):
         return PaymentCheckBalance(data=data)
 
     @classmethod
-    def validate_gateway(cls, gateway_id, manager):
-        gateways_id = [gateway.id for gateway in manager.list_payment_gateways()]
-
-        if gateway_id not in gateways_id:
+    def validate_gateway(cls, gateway_id, gateway_ids):
+        if gateway_id not in gateway_ids:
             raise ValidationError(
                 {
                     "gateway_id": ValidationError(
@@ -539,8 +575,8 @@ class PaymentCheckBalance(BaseMutation):
             )
 
     @classmethod
-    def validate_currency(cls, currency, gateway_id, manager):
-        if not is_currency_supported(currency, gateway_id, manager):
+    def validate_currency(cls, currency, gateway_id, currency_gateway_ids):
+        if gateway_id not in currency_gateway_ids:
             raise ValidationError(
                 {
                     "currency": ValidationError(
@@ -2,6 +2,7 @@ from unittest.mock import Mock, patch
 
 from .....payment import PaymentError
 from .....payment.error_codes import PaymentErrorCode
+from .....payment.interface import PaymentGateway
 from .....plugins.manager import PluginsManager
 from ....tests.utils import get_graphql_content
 from ...mutations import PaymentCheckBalance
@@ -189,3 +190,34 @@ def test_payment_check_balance_balance_raises_error(
         },
         "channel_default",
     )
+
+
+@patch.object(PluginsManager, "check_payment_balance")
+@patch.object(PluginsManager, "list_payment_gateways")
+@patch("saleor.graphql.payment.mutations.validate_channel")
+def test_payment_check_balance_lists_currency_gateways_once(
+    _,
+    list_payment_gateways_mock,
+    check_payment_balance_mock,
+    staff_api_client,
+    check_payment_balance_input,
+):
+    # Gateways may ignore the currency filter and not list the currency at all.
+    list_payment_gateways_mock.return_value = [
+        PaymentGateway(
+            id="mirumee.payments.gateway",
+            name="Gateway",
+            config=[],
+            currencies=[],
+        )
+    ]
+    check_payment_balance_mock.return_value = {}
+
+    response = staff_api_client.post_graphql(
+        MUTATION_CHECK_PAYMENT_BALANCE, {"input": check_payment_balance_input}
+    )
+
+    content = get_graphql_content(response)
+    assert not content["data"]["paymentCheckBalance"]["errors"]
+    list_payment_gateways_mock.assert_called_once_with(currency="GBP")
+    check_payment_balance_mock.assert_called_once()
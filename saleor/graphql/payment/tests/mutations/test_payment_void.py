@@ -1,6 +1,7 @@
 import graphene
 
 from .....payment import ChargeStatus, TransactionKind
+from .....payment.error_codes import PaymentErrorCode
 from ....tests.utils import get_graphql_content
 
 VOID_QUERY = """
@@ -12,6 +13,7 @@ VOID_QUERY = """
             }
             errors {
                 field
+                code
                 message
             }
         }
@@ -60,3 +62,22 @@ def test_payment_void_gateway_error(
     txn = payment_txn_preauth.transactions.last()
     assert txn.kind == TransactionKind.VOID
     assert not txn.is_success
+
+
+def test_payment_void_payment_without_order_and_checkout(
+    staff_api_client, permission_manage_orders, payment_txn_preauth
+):
+    payment_txn_preauth.order = None
+    payment_txn_preauth.save(update_fields=["order"])
+    payment_id = graphene.Node.to_global_id("Payment", payment_txn_preauth.pk)
+    variables = {"paymentId": payment_id}
+    response = staff_api_client.post_graphql(
+        VOID_QUERY, variables, permissions=[permission_manage_orders]
+    )
+    content = get_graphql_content(response)
+    data = content["data"]["paymentVoid"]
+    assert data["errors"][0]["field"] == "paymentId"
+    assert data["errors"][0]["code"] == PaymentErrorCode.INVALID.value.upper()
+    payment_txn_preauth.refresh_from_db()
+    assert payment_txn_preauth.is_active is True
+    assert payment_txn_preauth.transactions.count() == 1
@@ -1,17 +1,20 @@
 import json
 import logging
+import random
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from http.cookiejar import DefaultCookiePolicy
 from json import JSONDecodeError
 from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Type
-from urllib.parse import urlparse, urlunparse
+from urllib.parse import ParseResult, urlparse, urlunparse
 
-import boto3
 import requests
 from botocore.exceptions import ClientError
+from celery import group
 from celery.exceptions import MaxRetriesExceededError
 from celery.utils.log import get_task_logger
-from google.cloud import pubsub_v1
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
 from ...celeryconf import app
@@ -39,6 +42,16 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 task_logger = get_task_logger(__name__)
 
+# Shared across deliveries so connections to the same target host are kept alive
+# and reused instead of doing a new TCP/TLS handshake for every webhook.
+# Cookies are never stored, so one app's cookies can't leak to other deliveries.
+http_session = requests.Session()
+http_session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+http_session.mount("http://", HTTPAdapter(pool_connections=64, pool_maxsize=256))
+http_session.mount("https://", HTTPAdapter(pool_connections=64, pool_maxsize=256))
+
+WEBHOOK_RETRY_BACKOFF_MAX = 300
+
 
 class WebhookSchemes(str, Enum):
     HTTP = "http"
@@ -76,10 +89,7 @@ def _get_webhooks_for_event(event_type, webhooks=None):
         events__event_type__in=[event_type, WebhookEventAsyncType.ANY],
         **permissions,
     )
-    webhooks = webhooks.select_related("app").prefetch_related(
-        "app__permissions__content_type"
-    )
-    return webhooks
+    return webhooks.select_related("app")
 
 
 def trigger_webhooks_async(data, event_type, webhooks):
@@ -89,8 +99,9 @@ def trigger_webhooks_async(data, event_type, webhooks):
         event_payload=payload,
         event_type=event_type,
     )
-    for delivery in deliveries:
-        send_webhook_request_async.delay(delivery.id)
+    group(
+        [send_webhook_request_async.s(delivery.id) for delivery in deliveries]
+    ).apply_async()
 
 
 def trigger_webhook_sync(
@@ -116,7 +127,13 @@ def trigger_webhook_sync(
 
 
 def send_webhook_using_http(
-    target_url, message, domain, signature, event_type, timeout=WEBHOOK_TIMEOUT
+    target_url,
+    message,
+    domain,
+    signature,
+    event_type,
+    timeout=WEBHOOK_TIMEOUT,
+    parsed_url: Optional[ParseResult] = None,
 ):
     """Send a webhook request using http / https protocol.
 
@@ -126,6 +143,7 @@ def send_webhook_using_http(
     :param signature: Webhook secret key checksum.
     :param event_type: Webhook event type.
     :param timeout: Request timeout.
+    :param parsed_url: Unused, accepted for the same signature as other schemes.
 
     :return: WebhookResponse object.
     """
@@ -140,7 +158,9 @@ def send_webhook_using_http(
         "Saleor-Signature": signature,
     }
 
-    response = requests.post(target_url, data=message, headers=headers, timeout=timeout)
+    response = http_session.post(
+        target_url, data=message, headers=headers, timeout=timeout
+    )
     return WebhookResponse(
         content=response.text,
         request_headers=headers,
@@ -152,18 +172,33 @@ def send_webhook_using_http(
     )
 
 
-def send_webhook_using_aws_sqs(target_url, message, domain, signature, event_type):
-    parts = urlparse(target_url)
-    region = "us-east-1"
-    hostname_parts = parts.hostname.split(".")
-    if len(hostname_parts) == 4 and hostname_parts[0] == "sqs":
-        region = hostname_parts[1]
-    client = boto3.client(
+@lru_cache(maxsize=64)
+def get_sqs_client(region, access_key_id, secret_access_key):
+    """Return an SQS client shared by deliveries that use the same credentials."""
+    import boto3
+
+    return boto3.client(
         "sqs",
         region_name=region,
-        aws_access_key_id=parts.username,
-        aws_secret_access_key=parts.password,
+        aws_access_key_id=access_key_id,
+        aws_secret_access_key=secret_access_key,
     )
+
+
+def send_webhook_using_aws_sqs(
+    target_url,
+    message,
+    domain,
+    signature,
+    event_type,
+    parsed_url: Optional[ParseResult] = None,
+):
+    parts = parsed_url or urlparse(target_url)
+    region = "us-east-1"
+    hostname_parts = (parts.hostname or "").split(".")
+    if len(hostname_parts) == 4 and hostname_parts[0] == "sqs":
+        region = hostname_parts[1]
+    client = get_sqs_client(region, parts.username, parts.password)
     queue_url = urlunparse(
         ("https", parts.hostname, parts.path, parts.params, parts.query, parts.fragment)
     )
@@ -188,43 +223,66 @@ def send_webhook_using_aws_sqs(target_url, message, domain, signature, event_typ
         return WebhookResponse(content=response, duration=duration())
 
 
+@lru_cache(maxsize=1)
+def get_pubsub_publisher_client():
+    """Return the Pub/Sub publisher client shared by the current process.
+
+    The client is created on first use, so worker processes forked after import
+    do not share its gRPC channel. The library itself is imported here because it
+    pulls in gRPC and protobuf, which most processes never need.
+    """
+    from google.cloud import pubsub_v1
+
+    return pubsub_v1.PublisherClient()
+
+
 def send_webhook_using_google_cloud_pubsub(
-    target_url, message, domain, signature, event_type
+    target_url,
+    message,
+    domain,
+    signature,
+    event_type,
+    parsed_url: Optional[ParseResult] = None,
 ):
-    parts = urlparse(target_url)
-    client = pubsub_v1.PublisherClient()
+    from google.cloud.pubsub_v1.publisher.exceptions import MessageTooLargeError
+
+    parts = parsed_url or urlparse(target_url)
+    client = get_pubsub_publisher_client()
     topic_name = parts.path[1:]  # drop the leading slash
     with catch_duration_time() as duration:
-        future = client.publish(
-            topic_name,
-            message,
-            saleorDomain=domain,
-            eventType=event_type,
-            signature=signature,
-        )
+        try:
+            future = client.publish(
+                topic_name,
+                message,
+                saleorDomain=domain,
+                eventType=event_type,
+                signature=signature,
+            )
+        except MessageTooLargeError as e:
+            return WebhookResponse(content=str(e), status=EventDeliveryStatus.FAILED)
         response_duration = duration()
         response = future.result()
         return WebhookResponse(content=response, duration=response_duration)
 
 
+SCHEME_MATRIX: Dict[WebhookSchemes, Tuple[Callable, Tuple[Type[Exception], ...]]] = {
+    WebhookSchemes.HTTP: (send_webhook_using_http, (RequestException,)),
+    WebhookSchemes.HTTPS: (send_webhook_using_http, (RequestException,)),
+    WebhookSchemes.AWS_SQS: (send_webhook_using_aws_sqs, (ClientError,)),
+    WebhookSchemes.GOOGLE_CLOUD_PUBSUB: (
+        send_webhook_using_google_cloud_pubsub,
+        (RuntimeError,),
+    ),
+}
+
+
 def send_webhook_using_scheme_method(
     target_url, domain, secret, event_type, data
 ) -> WebhookResponse:
     parts = urlparse(target_url)
     message = data.encode("utf-8")
     signature = signature_for_payload(message, secret)
-    scheme_matrix: Dict[
-        WebhookSchemes, Tuple[Callable, Tuple[Type[Exception], ...]]
-    ] = {
-        WebhookSchemes.HTTP: (send_webhook_using_http, (RequestException,)),
-        WebhookSchemes.HTTPS: (send_webhook_using_http, (RequestException,)),
-        WebhookSchemes.AWS_SQS: (send_webhook_using_aws_sqs, (ClientError,)),
-        WebhookSchemes.GOOGLE_CLOUD_PUBSUB: (
-            send_webhook_using_google_cloud_pubsub,
-            (pubsub_v1.publisher.exceptions.MessageTooLargeError, RuntimeError),
-        ),
-    }
-    if method := scheme_matrix.get(parts.scheme.lower()):
+    if method := SCHEME_MATRIX.get(parts.scheme.lower()):
         send_method, send_exception = method
         try:
             return send_method(
@@ -233,12 +291,23 @@ def send_webhook_using_scheme_method(
                 domain,
                 signature,
                 event_type,
+                parsed_url=parts,
             )
         except send_exception as e:
             return WebhookResponse(content=str(e), status=EventDeliveryStatus.FAILED)
     raise ValueError("Unknown webhook scheme: %r" % (parts.scheme,))
 
 
+def get_retry_countdown(retry_backoff: int, retries: int) -> float:
+    """Return a jittered countdown for the next delivery attempt.
+
+    Randomizing the delay spreads out retries of deliveries that failed at the same
+    time, e.g. during a target app outage, instead of retrying them all at once.
+    """
+    upper_bound = min(WEBHOOK_RETRY_BACKOFF_MAX, retry_backoff * 3 * (2**retries))
+    return random.uniform(retry_backoff, max(retry_backoff, upper_bound))
+
+
 @app.task(
     bind=True,
     retry_backoff=10,
@@ -280,7 +349,9 @@ def send_webhook_request_async(self, event_delivery_id):
                 attempt.id,
             )
             try:
-                countdown = self.retry_backoff * (2**self.request.retries)
+                countdown = get_retry_countdown(
+                    self.retry_backoff, self.request.retries
+                )
                 self.retry(countdown=countdown, **self.retry_kwargs)
             except MaxRetriesExceededError:
                 task_logger.warning(
@@ -388,15 +459,19 @@ def send_webhook_request_sync(
 def trigger_webhooks_for_event(event_type, data):
     """Send a webhook request for an event as an async task."""
     webhooks = _get_webhooks_for_event(event_type)
-    for webhook in webhooks:
-        send_webhook_request.delay(
-            webhook.app.name,
-            webhook.pk,
-            webhook.target_url,
-            webhook.secret_key,
-            event_type,
-            data,
-        )
+    group(
+        [
+            send_webhook_request.s(
+                webhook.app.name,
+                webhook.pk,
+                webhook.target_url,
+                webhook.secret_key,
+                event_type,
+                data,
+            )
+            for webhook in webhooks
+        ]
+    ).apply_async()
 
 
 # to be removed in task: #1q2x7xw
@@ -414,31 +489,36 @@ def send_webhook_request(
     message = data.encode("utf-8")
     signature = signature_for_payload(message, secret)
 
-    scheme_matrix = {
-        WebhookSchemes.HTTP: (send_webhook_using_http, RequestException),
-        WebhookSchemes.HTTPS: (send_webhook_using_http, RequestException),
-        WebhookSchemes.AWS_SQS: (send_webhook_using_aws_sqs, ClientError),
-        WebhookSchemes.GOOGLE_CLOUD_PUBSUB: (
-            send_webhook_using_google_cloud_pubsub,
-            pubsub_v1.publisher.exceptions.MessageTooLargeError,
-        ),
-    }
-
-    if methods := scheme_matrix.get(parts.scheme.lower()):
+    if methods := SCHEME_MATRIX.get(parts.scheme.lower()):
         send_method, send_exception = methods
         try:
             with webhooks_opentracing_trace(event_type, domain, app_name=app_name):
-                send_method(target_url, message, domain, signature, event_type)
+                response = send_method(
+                    target_url,
+                    message,
+                    domain,
+                    signature,
+                    event_type,
+                    parsed_url=parts,
+                )
         except send_exception as e:
             task_logger.info("[Webhook] Failed request to %r: %r.", target_url, e)
             try:
-                countdown = self.retry_backoff * (2**self.request.retries)
+                countdown = get_retry_countdown(
+                    self.retry_backoff, self.request.retries
+                )
                 self.retry(countdown=countdown, **self.retry_kwargs)
             except MaxRetriesExceededError:
                 task_logger.warning(
                     "[Webhook] Failed request to %r: exceeded retry limit.",
                     target_url,
                 )
+        else:
+            if response.status == EventDeliveryStatus.FAILED:
+                task_logger.info(
+                    "[Webhook] Failed request to %r: %r.", target_url, response.content
+                )
+                return
         task_logger.info(
             "[Webhook ID:%r] Payload sent to %r for event %r",
             webhook_id,
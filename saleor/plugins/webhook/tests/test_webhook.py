@@ -44,7 +44,9 @@ from ....webhook.payloads import (
 )
 from ...manager import get_plugins_manager
 from ...webhook.tasks import (
+    WEBHOOK_RETRY_BACKOFF_MAX,
     WebhookResponse,
+    get_retry_countdown,
     send_webhook_request_async,
     trigger_webhooks_async,
 )
@@ -66,9 +68,9 @@ third_url = "http://www.example.com/third/"
         (WebhookEventAsyncType.CUSTOMER_CREATED, 0, set()),
     ],
 )
-@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_async.delay")
+@mock.patch("saleor.plugins.webhook.tasks.group")
 def test_trigger_webhooks_for_event_calls_expected_events(
-    mock_request,
+    mock_group,
     event_name,
     total_webhook_calls,
     expected_target_urls,
@@ -106,12 +108,13 @@ def test_trigger_webhooks_for_event_calls_expected_events(
     trigger_webhooks_async(
         event_payload, event_name, _get_webhooks_for_event(event_name)
     )
+    signatures = mock_group.call_args.args[0]
     deliveries_called = {
-        EventDelivery.objects.get(id=delivery_id[0][0])
-        for delivery_id in mock_request.call_args_list
+        EventDelivery.objects.get(id=signature.args[0]) for signature in signatures
     }
     urls_called = {delivery.webhook.target_url for delivery in deliveries_called}
-    assert mock_request.call_count == total_webhook_calls
+    mock_group.return_value.apply_async.assert_called_once_with()
+    assert len(signatures) == total_webhook_calls
     assert urls_called == expected_target_urls
 
 
@@ -825,7 +828,7 @@ def test_create_event_payload_reference_with_error(
     mocked_client_constructor = MagicMock(spec=boto3.client, return_value=mocked_client)
 
     monkeypatch.setattr(
-        "saleor.plugins.webhook.tasks.boto3.client",
+        "boto3.client",
         mocked_client_constructor,
     )
 
@@ -975,3 +978,14 @@ def test_send_webhook_request_async(
     assert attempt.request_headers == json.dumps(TEST_WEBHOOK_RESPONSE.request_headers)
     assert attempt.duration == TEST_WEBHOOK_RESPONSE.duration
     assert delivery.status == EventDeliveryStatus.SUCCESS
+
+
+@pytest.mark.parametrize(
+    "retries, expected_upper_bound",
+    [(0, 30), (1, 60), (3, 240), (5, WEBHOOK_RETRY_BACKOFF_MAX)],
+)
+def test_get_retry_countdown(retries, expected_upper_bound):
+    countdowns = {get_retry_countdown(10, retries) for _ in range(50)}
+
+    assert all(10 <= countdown <= expected_upper_bound for countdown in countdowns)
+    assert len(countdowns) > 1